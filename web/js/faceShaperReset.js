@@ -78,6 +78,7 @@ app.registerExtension({
                         "lip_size_x": 1.0,
                         "lip_upper_size_y": 1.0,
                         "lip_lower_size_y": 1.0,
+                        "output_dtype": "float32",
                     };
                     
                     // Clear settings_list input if it exists to avoid overriding reset values